@@ -4,8 +4,6 @@ This module provides fixtures for testing.
 WARNING:
 Why don't we just use command line arguments for base URL and passwords?
 Because it's annoying to type them out every time we want to run tests!
-
-TODO: storage state for UI and API
 """
 
 # --------------------------------------------------------------------------------
@@ -14,8 +12,9 @@ TODO: storage state for UI and API
 
 import json
 import pytest
+import re
 
-from playwright.sync_api import Playwright
+from playwright.sync_api import APIRequestContext, Browser, BrowserContext, Playwright
 from testlib.inputs import User
 
 
@@ -35,6 +34,93 @@ def _build_user(inputs, index):
   return user
 
 
+def _log_in_storage_state(playwright, base_url, user) -> dict:
+  api = playwright.request.new_context(base_url=base_url)
+  response = api.post('/login', form={'username': user.username, 'password': user.password})
+  assert response.ok, f"API login failed for user '{user.username}'"
+
+  storage_state = api.storage_state()
+  api.dispose()
+  return storage_state
+
+
+def _save_reminders(api):
+  response = api.get('/api/reminders')
+  assert response.ok
+  list_ids = [reminder_list['id'] for reminder_list in response.json()]
+
+  reminder_lists = []
+  for reminder_list in response.json():
+    response = api.get(f"/api/reminders/{reminder_list['id']}/items")
+    assert response.ok
+    items = [(item['description'], item['completed']) for item in response.json()]
+    reminder_lists.append((reminder_list['name'], items))
+
+  # GET /api/reminders/selected is shadowed by GET /api/reminders/{list_id},
+  # so read the selected list from the reminders page instead
+  response = api.get('/reminders')
+  assert response.ok
+  match = re.search(r'selected-list"\s+data-id="reminder-row-(\d+)"', response.text())
+  selected_index = list_ids.index(int(match.group(1))) if match else None
+
+  return reminder_lists, selected_index
+
+
+def _write_reminders(api, reminder_lists, selected_index):
+  # DELETE /api/reminders/delete-lists is shadowed by DELETE /api/reminders/{list_id},
+  # so delete the lists one at a time
+  response = api.get('/api/reminders')
+  assert response.ok
+  for reminder_list in response.json():
+    response = api.delete(f"/api/reminders/{reminder_list['id']}")
+    assert response.ok
+
+  list_ids = []
+  for name, items in reminder_lists:
+    response = api.post('/api/reminders', data={'name': name})
+    assert response.ok
+    list_id = response.json()['id']
+    list_ids.append(list_id)
+
+    for description, completed in items:
+      response = api.post(f'/api/reminders/{list_id}/items', data={'description': description})
+      assert response.ok
+      if completed:
+        response = api.patch(f"/api/reminders/items/strike/{response.json()['id']}")
+        assert response.ok
+
+  if selected_index is not None:
+    response = api.post(f'/api/reminders/select/{list_ids[selected_index]}')
+  else:
+    response = api.post('/api/reminders/unselect')
+  assert response.ok
+
+
+def _seed_reminders(api, reminder_lists):
+  lists = [
+    (name, [(description, False) for description in descriptions])
+    for name, descriptions in reminder_lists.items()
+  ]
+  _write_reminders(api, lists, 0 if lists else None)
+
+
+# --------------------------------------------------------------------------------
+# Reminders Seeds
+# --------------------------------------------------------------------------------
+
+REMINDERS_SEEDS = {
+  'empty': {},
+  'one_list': {
+    'Groceries': ['Milk', 'Eggs', 'Bread'],
+  },
+  'many': {
+    'Groceries': ['Milk', 'Eggs', 'Bread'],
+    'Chores': ['Vacuum', 'Do laundry'],
+    'Errands': ['Mail package', 'Pick up prescription', 'Return library books'],
+  },
+}
+
+
 # --------------------------------------------------------------------------------
 # Input Fixtures
 # --------------------------------------------------------------------------------
@@ -64,8 +150,110 @@ def alt_user(test_inputs):
 
 # --------------------------------------------------------------------------------
 # Playwright Fixtures
+#
+#   The browser is launched once per session (per worker);
+#   each test only opens a new context and page.
 # --------------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope='session')
+def browser_type_launch_args(browser_type_launch_args: dict):
+  return {'headless': True, **browser_type_launch_args}
+
+
+@pytest.fixture(scope='session')
+def browser_context_args(browser_context_args: dict, base_url: str):
+  return {**browser_context_args, 'base_url': base_url}
+
+
+# Shared across the session, so tests must not log it in
+@pytest.fixture(scope='session')
 def bulldoggy_api(playwright: Playwright, base_url: str):
-  return playwright.request.new_context(base_url=base_url)
+  context = playwright.request.new_context(base_url=base_url)
+  yield context
+  context.dispose()
+
+
+@pytest.fixture
+def fresh_api(playwright: Playwright, base_url: str):
+  context = playwright.request.new_context(base_url=base_url)
+  yield context
+  context.dispose()
+
+
+# Session cookies are stateless tokens, and logging out only expires the
+# cookie in its own browser context, so one login per session is safe to share.
+
+@pytest.fixture(scope='session')
+def user_storage_state(playwright: Playwright, base_url: str, user: User):
+  return _log_in_storage_state(playwright, base_url, user)
+
+
+@pytest.fixture(scope='session')
+def alt_storage_state(playwright: Playwright, base_url: str, alt_user: User):
+  return _log_in_storage_state(playwright, base_url, alt_user)
+
+
+@pytest.fixture
+def logged_in_context(browser: Browser, browser_context_args: dict, user_storage_state: dict):
+  context = browser.new_context(**browser_context_args, storage_state=user_storage_state)
+  yield context
+  context.close()
+
+
+@pytest.fixture(scope='session')
+def guest_context(browser: Browser, browser_context_args: dict):
+  context = browser.new_context(**browser_context_args)
+
+  # Logged-out tests only check URLs and DOM structure, so skip styling and images
+  context.route('**/*.{png,jpg,svg,ico,ttf,woff,woff2,css}', lambda route: route.abort())
+
+  yield context
+  context.close()
+
+
+@pytest.fixture
+def guest_page(guest_context: BrowserContext):
+  page = guest_context.new_page()
+  yield page
+  page.close()
+
+
+# --------------------------------------------------------------------------------
+# Reminders Fixtures
+#
+#   The second user in inputs.json (alt_user) is reserved for these tests:
+#   seeding replaces that user's reminders through the app's API, so only the
+#   app process writes the database. The user's original reminders are saved
+#   first and written back after each test.
+#   Tests that use these fixtures share the 'alt_user_reminders' xdist group.
+# --------------------------------------------------------------------------------
+
+@pytest.fixture
+def alt_reminders_api(playwright: Playwright, base_url: str, alt_storage_state: dict):
+  api = playwright.request.new_context(base_url=base_url, storage_state=alt_storage_state)
+  saved_lists, saved_selected_index = _save_reminders(api)
+  yield api
+  _write_reminders(api, saved_lists, saved_selected_index)
+  api.dispose()
+
+
+@pytest.fixture
+def alt_logged_in_context(browser: Browser, browser_context_args: dict, alt_storage_state: dict):
+  context = browser.new_context(**browser_context_args, storage_state=alt_storage_state)
+  yield context
+  context.close()
+
+
+@pytest.fixture
+def seeded_reminders_empty(alt_reminders_api: APIRequestContext):
+  _seed_reminders(alt_reminders_api, REMINDERS_SEEDS['empty'])
+
+
+@pytest.fixture
+def seeded_reminders_one_list(alt_reminders_api: APIRequestContext):
+  _seed_reminders(alt_reminders_api, REMINDERS_SEEDS['one_list'])
+
+
+@pytest.fixture
+def seeded_reminders_many(alt_reminders_api: APIRequestContext):
+  _seed_reminders(alt_reminders_api, REMINDERS_SEEDS['many'])
@@ -14,14 +14,14 @@ from testlib.inputs import User
 # Tests
 # --------------------------------------------------------------------------------
 
-def test_successful_api_login(bulldoggy_api: APIRequestContext, user: User, base_url: str):
+def test_successful_api_login(fresh_api: APIRequestContext, user: User, base_url: str):
   """
   Test case for a successful API login.
 
   This function tests the functionality of the API login endpoint by sending a POST request to the '/login' route with valid user credentials. It asserts that the response is successful (status code 200) and that the redirected URL matches the expected value. It also checks that the 'reminders_session' cookie is set correctly.
 
   Parameters:
-  - bulldoggy_api (APIRequestContext): The API request context object used to send the login request.
+  - fresh_api (APIRequestContext): A short-lived API request context used to send the login request.
   - user (User): The User object representing the user credentials.
   - base_url (str): The base URL of the API.
 
@@ -29,10 +29,51 @@ def test_successful_api_login(bulldoggy_api: APIRequestContext, user: User, base
   None
   """
 
-  response = bulldoggy_api.post('/login', form={'username': user.username, 'password': user.password})
+  response = fresh_api.post('/login', form={'username': user.username, 'password': user.password})
   assert response.ok
   assert response.url == f'{base_url}/reminders'
 
-  cookie = bulldoggy_api.storage_state()['cookies'][0]
+  cookie = fresh_api.storage_state()['cookies'][0]
   assert cookie['name'] == 'reminders_session'
   assert cookie['value']
+
+
+def test_load_login_page(bulldoggy_api: APIRequestContext):
+  """
+  Test case for verifying that the login page HTML is served correctly.
+
+  This function fetches the login page without a browser, since the page needs no JavaScript to render. It asserts that the response is successful and that the page contains the logo and the login button.
+
+  Parameters:
+  - bulldoggy_api (APIRequestContext): The API request context object used to fetch the page.
+
+  Returns:
+  None
+  """
+
+  response = bulldoggy_api.get('/login')
+  assert response.ok
+
+  body = response.text()
+  assert 'id="bulldoggy-logo"' in body
+  assert 'data-testid="login-button"' in body
+
+
+def test_invalid_navigation_redirects_to_not_found(bulldoggy_api: APIRequestContext, base_url: str):
+  """
+  Test case for verifying that invalid navigation redirects to the not found page.
+
+  This function requests an invalid URL without a browser. It asserts that the request is redirected to the '/not-found' route and that the not found page is returned.
+
+  Parameters:
+  - bulldoggy_api (APIRequestContext): The API request context object used to fetch the page.
+  - base_url (str): The base URL of the app.
+
+  Returns:
+  None
+  """
+
+  response = bulldoggy_api.get('/invalid-url')
+  assert response.ok
+  assert response.url == f'{base_url}/not-found'
+  assert 'Not found!' in response.text()
@@ -6,15 +6,24 @@ This module contains Web UI tests for the Bulldoggy app.
 # Imports
 # --------------------------------------------------------------------------------
 
-import re
+import pytest
 
-from playwright.sync_api import Page, expect
+from playwright.sync_api import BrowserContext, Page, expect
 from testlib.inputs import User
+from testlib.pages import LOGIN_URL_RE, REMINDERS_URL_RE, log_in_with_keyboard
+
+
+# Stands in for the user's own username or password in parametrized credentials
+VALID = object()
+
+# Milliseconds to wait for the login page, shorter than Playwright's 5s default
+LOGIN_PAGE_TIMEOUT = 1500
 
 # --------------------------------------------------------------------------------
 # Helpers
 # 
 #   login page displays correctly
+#   reminders page is reached
 #   reminders page displays correctly
 # --------------------------------------------------------------------------------
 
@@ -29,32 +38,29 @@ def verify_login_page(page: Page):
   Returns:
   None
   """
-  expect(page).to_have_url(re.compile(re.escape('/') + 'login'))
-  expect(page.locator('id=bulldoggy-logo')).to_be_visible()
-  expect(page.get_by_role('button', name='Login')).to_be_visible()
+  # Fail fast: staying on the login page should never take long
+  expect(page).to_have_url(LOGIN_URL_RE, timeout=LOGIN_PAGE_TIMEOUT)
+
+  # The logo and login button are fixed parts of the login template
+  expect(page.locator('#bulldoggy-logo, button[type="submit"]')).to_have_count(2, timeout=LOGIN_PAGE_TIMEOUT)
 
 
-def verify_reminders_page(page: Page, user: User):
+def verify_reminders_page_fast(page: Page):
   """
-  Verify the reminders page by checking if the page title, URL, and specific elements are as expected.
+  Verify that the reminders page was reached by checking only the URL.
 
   Parameters:
   - page (Page): The Playwright Page object representing the browser page.
-  - user (User): The User object representing the user credentials.
 
   Returns:
   None
   """
-  expect(page).to_have_url(re.compile(re.escape('/') + 'reminders'))
-  expect(page.locator('id=bulldoggy-logo')).to_be_visible()
-  expect(page.locator('id=bulldoggy-title')).to_have_text('Bulldoggy')
-  expect(page.get_by_role('button', name='Logout')).to_be_visible()
-  expect(page.locator('id=reminders-message')).to_have_text(f'Reminders for {user.username}')
+  expect(page).to_have_url(REMINDERS_URL_RE)
 
 
-def log_in(page: Page, user: User):
+def verify_reminders_page_full(page: Page, user: User):
   """
-  Log in to the app by providing valid credentials.
+  Verify the reminders page by checking if the page title, URL, and specific elements are as expected.
 
   Parameters:
   - page (Page): The Playwright Page object representing the browser page.
@@ -63,9 +69,20 @@ def log_in(page: Page, user: User):
   Returns:
   None
   """
-  page.locator('[name="username"]').fill(user.username)
-  page.locator('[name="password"]').fill(user.password)
-  page.get_by_text('Login').click()
+  verify_reminders_page_fast(page)
+
+  # The URL changes before the new page is parsed, so wait for its content too
+  expect(page.locator('#reminders-message')).to_have_text(f'Reminders for {user.username}')
+
+  # Read everything else in one round trip once the page has rendered
+  snapshot = page.evaluate("""() => ({
+    logo: !!document.getElementById('bulldoggy-logo'),
+    title: document.getElementById('bulldoggy-title')?.textContent.trim(),
+    logout: document.querySelector('#logout-form button')?.textContent.trim(),
+  })""")
+  assert snapshot['logo']
+  assert snapshot['title'] == 'Bulldoggy'
+  assert snapshot['logout'] == 'Logout'
 
 
 # --------------------------------------------------------------------------------
@@ -97,7 +114,7 @@ def test_successful_login(page: Page, user: User):
   This test case performs the following steps:
   1. Navigates to the login page.
   2. Fills in the username and password fields with the provided user credentials.
-  3. Clicks the "Login" button.
+  3. Presses Enter to submit the login form.
   4. Verifies that the login process is successful.
 
   Note: This test case assumes the presence of the Playwright library and the necessary setup for running browser tests.
@@ -106,173 +123,82 @@ def test_successful_login(page: Page, user: User):
   page.goto('/login')
 
   # When the user provides valid credentials
-  log_in(page, user)
+  log_in_with_keyboard(page, user)
 
   # Then verify that the reminders page is displayed correctly
-  verify_reminders_page(page, user)
-
-
-def test_no_credentials(page: Page):
+  verify_reminders_page_full(page, user)
+
+
+@pytest.mark.parametrize(
+  'username, password, shows_error',
+  [
+    (None, None, False),
+    (None, VALID, False),
+    (VALID, None, False),
+    ('invalid-username', VALID, True),
+    (VALID, 'invalid-password', True),
+  ],
+  ids=['no-credentials', 'no-username', 'no-password', 'incorrect-username', 'incorrect-password'])
+def test_invalid_login(guest_page: Page, user: User, username, password, shows_error: bool):
   """
-  Test case for verifying that an error message is displayed when no login credentials are provided.
+  Test case for verifying that login fails for missing or incorrect credentials.
 
   Parameters:
-  - page (Page): The Playwright Page object representing the browser page.
-
-  Returns:
-  None
-
-  This test case performs the following steps:
-  1. Navigates to the login page.
-  2. Clicks the "Login" button.
-  3. Verifies that the login process is unsuccessful.
-  """
-  # Given the login page is displayed
-  page.goto('/login')
-
-  # When the user provides no login credentials
-  page.get_by_text('Login').click()
-
-  # Then the login page does not change until the user provides
-  #   both username and password (those could still be incorrect).
-  verify_login_page(page)
-
-
-def test_no_username(page: Page, user: User):
-  """
-  Test case for verifying that an error message is displayed when no username is provided.
-
-  Parameters:
-  - page (Page): The Playwright Page object representing the browser page.
+  - guest_page (Page): A fresh page in the browser context shared by logged-out tests.
   - user (User): The User object representing the user credentials.
+  - username: The username to enter, VALID for the user's own, or None to leave it blank.
+  - password: The password to enter, VALID for the user's own, or None to leave it blank.
+  - shows_error (bool): Whether the app rejects the credentials with an error message.
+    Missing fields are blocked by the browser before the form is submitted.
 
   Returns:
   None
 
   This test case performs the following steps:
   1. Navigates to the login page.
-  2. Fills in the password field with the provided user credentials.
-  3. Clicks the "Login" button.
-  4. Verifies that the login process is unsuccessful.
-  """
-  # Given the login page is displayed
-  page.goto('/login')
-
-  # When the user provides no username
-  page.locator('[name="password"]').fill(user.password)
-  page.get_by_text('Login').click()
-
-  # Then the login process is not executed
-  verify_login_page(page)
-
-
-def test_no_password(page: Page, user: User):
+  2. Fills in the provided username and password fields.
+  3. Presses Enter to submit the login form.
+  4. Verifies that the login page is still displayed, with an error message if expected.
   """
-  Test case for verifying that an error message is displayed when no password is provided.
+  page = guest_page
 
-  Parameters:
-  - page (Page): The Playwright Page object representing the browser page.
-  - user (User): The User object representing the user credentials.
-
-  Returns:
-  None
-
-  This test case performs the following steps:
-  1. Navigates to the login page.
-  2. Fills in the username field with the provided user credentials.
-  3. Clicks the "Login" button.
-  4. Verifies that the login process is unsuccessful.
-  """
   # Given the login page is displayed
   page.goto('/login')
 
-  # When the user provides no password
-  page.locator('[name="username"]').fill(user.username)
-  page.get_by_text('Login').click()
+  # When the user provides missing or incorrect credentials
+  if username is not None:
+    page.locator('[name="username"]').fill(user.username if username is VALID else username)
+  if password is not None:
+    page.locator('[name="password"]').fill(user.password if password is VALID else password)
+  page.locator('[name="password"]').press('Enter')
 
-  # Then the login process is not executed
+  # Then the login page is still displayed
   verify_login_page(page)
 
+  # And the error message is displayed only for incorrect credentials
+  if shows_error:
+    expect(page.locator('text=Invalid login! Please retry.')).to_be_visible()
 
-def test_incorrect_username(page: Page, user: User):
-  """
-  Test case for verifying that an error message is displayed when an incorrect username is provided.
-
-  Parameters:
-  - page (Page): The Playwright Page object representing the browser page.
-  - user (User): The User object representing the user credentials.
-
-  Returns:
-  None
-
-  This test case performs the following steps:
-  1. Navigates to the login page.
-  2. Fills in the username and password fields with incorrect credentials.
-  3. Clicks the "Login" button.
-  4. Verifies that the error message is displayed.
-  """
-  # Given the login page is displayed
-  page.goto('/login')
-
-  # When the user provides incorrect username, but correct password
-  page.locator('[name="username"]').fill('invalid-username')
-  page.locator('[name="password"]').fill(user.password)
-  page.get_by_text('Login').click()
-
-  # Then the error message is displayed
-  expect(page.locator('text=Invalid login! Please retry.')).to_be_visible()
-
-
-def test_incorrect_password(page: Page, user: User):
-  """
-  Test case for verifying that an error message is displayed when an incorrect password is provided.
-
-  Parameters:
-  - page (Page): The Playwright Page object representing the browser page.
-  - user (User): The User object representing the user credentials.
-
-  Returns:
-  None
-
-  This test case performs the following steps:
-  1. Navigates to the login page.
-  2. Fills in the username and password fields with incorrect credentials.
-  3. Clicks the "Login" button.
-  4. Verifies that the error message is displayed.
-  """
-  # Given the login page is displayed
-  page.goto('/login')
-
-  # When the user provides correct username, but incorrect password
-  page.locator('[name="username"]').fill(user.username)
-  page.locator('[name="password"]').fill('invalid-password')
-  page.get_by_text('Login').click()
-
-  # Then the error message is displayed
-  expect(page.locator('text=Invalid login! Please retry.')).to_be_visible()
 
-
-def test_successful_logout(page: Page, user: User):
+def test_successful_logout(logged_in_context: BrowserContext):
   """
   Test case for verifying that the user can successfully log out.
 
   Parameters:
-  - page (Page): The Playwright Page object representing the browser page.
-  - user (User): The User object representing the user credentials.
+  - logged_in_context (BrowserContext): A browser context holding the session cookie from an API login.
 
   Returns:
   None
 
   This test case performs the following steps:
-  1. Navigates to the login page.
-  2. Fills in the username and password fields with the provided user credentials.
-  3. Clicks the "Login" button.
-  4. Clicks the "Logout" button.
-  5. Verifies that the login page and the logout message are displayed.
+  1. Navigates to the reminders page as a logged-in user.
+  2. Clicks the "Logout" button.
+  3. Verifies that the login page and the logout message are displayed.
   """
-  # Given the login process is successful
-  page.goto('/login')
-  log_in(page, user)
+  page = logged_in_context.new_page()
+
+  # Given the user is logged in
+  page.goto('/reminders')
 
   # When the user clicks the logout button
   page.get_by_text('Logout').click()
@@ -284,17 +210,19 @@ def test_successful_logout(page: Page, user: User):
 # --------------------------------------------------------------------------------
 # Navigation Behaviors
 #
-#   load the login page
+#   login page renders
 #   load the reminders page
 #   home redirects to login when not authenticated
 #   home redirects to reminders when logged in
-#   invalid navigation redirects to not found
+#
+#   The login page HTML and invalid navigation are checked by API tests;
+#   the render test below is the one full browser load of the login page.
 # --------------------------------------------------------------------------------
 
 
-def test_load_login_page(page: Page):
+def test_login_page_renders(page: Page):
   """
-  Test case for verifying that the login page is loaded correctly.
+  Test case for verifying that the login page renders fully in the browser, including styling and images.
 
   Parameters:
   - page (Page): The Playwright Page object representing the browser page.
@@ -304,7 +232,7 @@ def test_load_login_page(page: Page):
 
   This test case performs the following steps:
   1. Navigates to the login page.
-  2. Verifies that the login page is displayed.
+  2. Verifies that the logo and the "Login" button are visible.
   """
 
   # Given the code is correctly running
@@ -312,43 +240,42 @@ def test_load_login_page(page: Page):
   # When the user navigates to the login page
   page.goto('/login')
 
-  # Then the login page is displayed
-  verify_login_page(page)
+  # Then the logo and the login button are visible
+  expect(page.locator('#bulldoggy-logo')).to_be_visible()
+  expect(page.get_by_role('button', name='Login')).to_be_visible()
 
 
-def test_load_reminders_page(page: Page, user: User):
+def test_load_reminders_page(logged_in_context: BrowserContext, user: User):
   """
   Test case for verifying that the reminders page is loaded correctly.
 
   Parameters:
-  - page (Page): The Playwright Page object representing the browser page.
+  - logged_in_context (BrowserContext): A browser context holding the session cookie from an API login.
   - user (User): The User object representing the user credentials.
 
   Returns:
   None
 
   This test case performs the following steps:
-  1. Navigates to the login page.
-  2. Fills in the username and password fields with the provided user credentials.
-  3. Clicks the "Login" button.
-  4. Verifies that the reminders page is displayed.
+  1. Navigates to the reminders page as a logged-in user.
+  2. Verifies that the reminders page is displayed.
   """
-  # Given the login process is successful
-  page.goto('/login')
-  log_in(page, user)
+  page = logged_in_context.new_page()
+
+  # Given the user is logged in
 
   # When the user navigates to the reminders page
   page.goto('/reminders')
 
   # Then the reminders page is displayed
-  verify_reminders_page(page, user)
+  verify_reminders_page_full(page, user)
 
-def test_home_redirects_to_login_when_not_authenticated(page: Page):
+def test_home_redirects_to_login_when_not_authenticated(guest_page: Page):
   """
   Test case for verifying that the home page redirects to the login page when the user is not authenticated.
 
   Parameters:
-  - page (Page): The Playwright Page object representing the browser page.
+  - guest_page (Page): A fresh page in the browser context shared by logged-out tests.
 
   Returns:
   None
@@ -357,62 +284,36 @@ def test_home_redirects_to_login_when_not_authenticated(page: Page):
   1. Navigates to the home page.
   2. Verifies that the login page is displayed.
   """
+  page = guest_page
+
   page.goto('/')
   verify_login_page(page)
 
 
-def test_home_redirects_to_reminders_when_logged_in(page: Page, user: User):
+def test_home_redirects_to_reminders_when_logged_in(logged_in_context: BrowserContext):
   """
   Test case for verifying that the home page redirects to the reminders page when the user is logged in.
 
   Parameters:
-  - page (Page): The Playwright Page object representing the browser page.
-  - user (User): The User object representing the user credentials.
+  - logged_in_context (BrowserContext): A browser context holding the session cookie from an API login.
 
   Returns:
   None
 
   This test case performs the following steps:
-  1. Navigates to the login page.
-  2. Fills in the username and password fields with the provided user credentials.
-  3. Clicks the "Login" button.
-  4. Navigates to the home page.
-  5. Verifies that the reminders page is displayed with the correct user information.
+  1. Navigates to the home page as a logged-in user.
+  2. Verifies that the browser is redirected to the reminders page.
   """
+  page = logged_in_context.new_page()
 
   # Given the user is logged in
-  page.goto('/login')
-  log_in(page, user)
 
   # When the user navigates to the home page
   page.goto('/')
 
-  # Then the reminders page is displayed with the correct user information
-  verify_reminders_page(page, user)
-
-
-def test_invalid_navigation_redirects_to_not_found(page: Page):
-  """
-  Test case for verifying that invalid navigation redirects to the not found page.
-
-  Parameters:
-  - page (Page): The Playwright Page object representing the browser page.
-
-  Returns:
-  None
-
-  This test case performs the following steps:
-  1. Navigates to an invalid URL.
-  2. Verifies that the not found page is displayed.
-  """
-
-  # Given the code is correctly running
-
-  # When the user navigates to an invalid URL
-  page.goto('/invalid-url')
+  # Then the browser is redirected to the reminders page
+  verify_reminders_page_fast(page)
 
-  # Then the not found page is displayed
-  expect(page.locator('text=Not Found')).to_be_visible()
 
 # --------------------------------------------------------------------------------
 # Reminders Behaviors
@@ -454,6 +355,63 @@ def test_invalid_navigation_redirects_to_not_found(page: Page):
 # --------------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group('alt_user_reminders')
+def test_initial_reminders_page_is_empty(alt_logged_in_context: BrowserContext, seeded_reminders_empty):
+  """
+  Test case for verifying that the reminders page is empty when the user has no reminder lists.
+
+  Parameters:
+  - alt_logged_in_context (BrowserContext): A browser context logged in as the alternate user.
+  - seeded_reminders_empty: Removes all of the alternate user's reminder lists.
+
+  Returns:
+  None
+
+  This test case performs the following steps:
+  1. Navigates to the reminders page as a logged-in user with no lists.
+  2. Verifies that no lists and no selected list are displayed.
+  """
+  page = alt_logged_in_context.new_page()
+
+  # Given the user has no reminder lists
+
+  # When the user navigates to the reminders page
+  page.goto('/reminders')
+
+  # Then no lists or items are displayed
+  expect(page.locator('[data-id^="reminder-row-"]')).to_have_count(0)
+  expect(page.locator('.reminders-item-list')).to_have_count(0)
+
+
+@pytest.mark.xdist_group('alt_user_reminders')
+def test_first_list_is_selected(alt_logged_in_context: BrowserContext, seeded_reminders_one_list):
+  """
+  Test case for verifying that a user's only reminder list is shown with its items.
+
+  Parameters:
+  - alt_logged_in_context (BrowserContext): A browser context logged in as the alternate user.
+  - seeded_reminders_one_list: Gives the alternate user one selected list of three items.
+
+  Returns:
+  None
+
+  This test case performs the following steps:
+  1. Navigates to the reminders page as a logged-in user with one list.
+  2. Verifies that the list is selected and its items are displayed.
+  """
+  page = alt_logged_in_context.new_page()
+
+  # Given the user has one reminder list
+
+  # When the user navigates to the reminders page
+  page.goto('/reminders')
+
+  # Then the list is selected and its items are displayed
+  expect(page.locator('[data-id^="reminder-row-"]')).to_have_count(1)
+  expect(page.locator('.selected-list')).to_have_text('Groceries')
+  expect(page.locator('[data-id^="reminder-item-row-"]')).to_have_text(['Milk', 'Eggs', 'Bread'])
+
+
 # --------------------------------------------------------------------------------
 # User Behaviors
 #
@@ -5,25 +5,34 @@ This module contains unit tests for the Bulldoggy app.
 # --------------------------------------------------------------------------------
 # Imports
 # --------------------------------------------------------------------------------
-import sys
-import os
-
-# Append the project root directory to sys.path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
 from app.utils.auth import serialize_token, deserialize_token
 from testlib.inputs import User
 
+
+pytestmark = pytest.mark.no_browser
+
+# --------------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------------
+
+@pytest.fixture(scope='session')
+def user_token(user: User):
+  return serialize_token(user.username)
+
+
 # --------------------------------------------------------------------------------
 # Tests
 # --------------------------------------------------------------------------------
 
-def test_token_serialization(user: User):
+def test_token_serialization(user: User, user_token: str):
   """
   Test the serialization and deserialization of a token for a given user.
 
   Args:
       user (User): The user object to serialize and deserialize a token for.
+      user_token (str): The token serialized once per session for the user.
 
   Raises:
       AssertionError: If the generated token is None, not a string, or equal to the user's username.
@@ -33,7 +42,7 @@ def test_token_serialization(user: User):
       None
   """
 
-  token = serialize_token(user.username)
+  token = user_token
   assert token
   assert isinstance(token, str)
   assert token != user.username
@@ -2,12 +2,18 @@
 This module provides support for test inputs.
 """
 
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+from dataclasses import dataclass
+
+
 # --------------------------------------------------------------------------------
 # Class: User
 # --------------------------------------------------------------------------------
 
+@dataclass(frozen=True)
 class User:
-
-  def __init__(self, username, password):
-    self.username = username
-    self.password = password
+  username: str
+  password: str
@@ -0,0 +1,41 @@
+"""
+This module provides shared page interactions for UI tests.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import re
+
+from playwright.sync_api import Page
+from testlib.inputs import User
+
+
+# --------------------------------------------------------------------------------
+# URL Patterns
+# --------------------------------------------------------------------------------
+
+LOGIN_URL_RE = re.compile(re.escape('/') + 'login')
+REMINDERS_URL_RE = re.compile(re.escape('/') + 'reminders')
+
+
+# --------------------------------------------------------------------------------
+# Interactions
+# --------------------------------------------------------------------------------
+
+def log_in_with_keyboard(page: Page, user: User):
+  """
+  Log in to the app by typing valid credentials like a real user would.
+  Tests that only need a logged-in session should use the logged_in_context fixture instead.
+
+  Parameters:
+  - page (Page): The Playwright Page object representing the browser page.
+  - user (User): The User object representing the user credentials.
+
+  Returns:
+  None
+  """
+  page.locator('[name="username"]').fill(user.username)
+  page.locator('[name="password"]').fill(user.password)
+  page.locator('[name="password"]').press('Enter')